@@ -9,8 +9,11 @@ import os
 import time
 import psutil
 import pygame
+import pygame.freetype
 import math
 import logging
+import threading
+from pygame._sdl2.video import Window, Renderer, Texture
 
 # ================= CONFIGURATION =================
 WIDTH, HEIGHT = 1280, 720           # reTerminal native resolution
@@ -22,6 +25,7 @@ COLOR_NEON_MAGENTA = (255, 40, 255)
 COLOR_GRID = (18, 35, 55)
 COLOR_TEXT = (210, 245, 255)
 COLOR_GLOW = (0, 120, 120)
+ARC_COLORKEY = (0, 0, 0)            # transparent key of the cached arc surfaces
 
 # ================= LOGGING SETUP =================
 # Changed: Added proper logging to file for debugging when running as service
@@ -33,9 +37,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ================= FONTS =================
+# Changed: Fonts are built once by init_fonts() instead of 3x SysFont per gauge per frame
+# Changed: pygame.freetype instead of SDL_ttf; gauge values are drawn from a
+# pre-rendered digit atlas, so no text is rasterized on the render path
+FONT_VAL = None
+FONT_UNIT = None
+FONT_LABEL = None
+DIGITS = {}         # '0'..'9' -> glyph surface (subsurface of one atlas)
+
+
+def ft_font(size, bold=False):
+    """DejaVu Sans Mono as a freetype font, padded to font.Font-style line boxes"""
+    font = pygame.freetype.SysFont('dejavusansmono', size, bold=bold)
+    font.pad = True
+    return font
+
+
+def build_glyph_atlas(font, chars, color):
+    """Render chars once into a single surface, return {char: subsurface}"""
+    glyphs = [font.render(ch, color)[0] for ch in chars]
+    atlas = pygame.Surface((sum(g.get_width() for g in glyphs),
+                            max(g.get_height() for g in glyphs)), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    regions = {}
+    x = 0
+    for ch, glyph in zip(chars, glyphs):
+        # RGBA_MAX onto a fully transparent atlas copies the glyph pixels as they are
+        atlas.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        regions[ch] = atlas.subsurface((x, 0, glyph.get_width(), atlas.get_height()))
+        x += glyph.get_width()
+    return regions
+
+
+def init_fonts():
+    """Create the shared gauge fonts and digit atlas (must be called after pygame.init())"""
+    global FONT_VAL, FONT_UNIT, FONT_LABEL, DIGITS
+    FONT_VAL = ft_font(46, bold=True)
+    FONT_UNIT = ft_font(20)
+    FONT_LABEL = ft_font(18)
+    DIGITS = build_glyph_atlas(FONT_VAL, '0123456789', COLOR_TEXT)
+
+# Arc end angle for every integer percentage; index = arc cache frame
+_END_ANGLES = [math.pi + i / 100 * math.pi for i in range(101)]
+
 # ================= CYBER GAUGE CLASS =================
 class CyberGauge:
     """Circular neon-style gauge with smooth animation"""
+    _arc_cache = {}     # radius -> arc frames for 0..100 % (textures after upload_arcs())
+    ARC_MARGIN = 4      # rows kept above the centre line
+
     def __init__(self, x, y, radius, label, unit="%", max_value=100):
         self.x = x
         self.y = y
@@ -47,6 +98,20 @@ class CyberGauge:
         self.target_val = 0.0
         self.smooth_val = 0.0
 
+        # Label and unit never change - render them once
+        self._label_surf = FONT_LABEL.render(label.upper(), COLOR_GRID)[0]
+        self._unit_surf = FONT_UNIT.render(unit, COLOR_NEON_MAGENTA)[0]
+        self._unit_pos = (x + radius - 15, y - 12)
+        self._label_pos = (x - self._label_surf.get_width()//2, y + radius//2 + 8)
+        if radius not in self._arc_cache:
+            self._build_cache(radius)
+        self._arc_pos = (x - radius, y - self.ARC_MARGIN)
+        # Value glyph blits are only rebuilt when the displayed integer changes
+        self._last_int_val = -1
+        self._val_blits = []
+        # What was last drawn, so idle frames can skip present()
+        self._drawn_state = None
+
     def update(self, value):
         """Set new target value (clamped)"""
         self.target_val = min(max(value, 0), self.max_value)
@@ -56,44 +121,201 @@ class CyberGauge:
         # Changed: Slightly faster smoothing factor for more responsive feel
         self.smooth_val += (self.target_val - self.smooth_val) * 0.12
 
-    def draw(self, surface):
-        rect = pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius*2, self.radius*2)
-        
-        # Background arc (static 180° bottom)
-        pygame.draw.arc(surface, COLOR_GRID, rect, math.pi, 0, 4)
-        
-        # Progress arc with neon glow
-        progress = self.smooth_val / self.max_value
-        end_angle = math.pi + progress * math.pi
-        
-        pygame.draw.arc(surface, COLOR_NEON_CYAN, rect, math.pi, end_angle, 8)
-        pygame.draw.arc(surface, COLOR_GLOW, rect, math.pi, end_angle, 14)
-        
-        # Text rendering
-        font_val = pygame.font.SysFont('dejavusansmono', 46, bold=True)
-        font_unit = pygame.font.SysFont('dejavusansmono', 20)
-        font_label = pygame.font.SysFont('dejavusansmono', 18)
-        
-        val_str = f"{int(round(self.smooth_val))}"
-        val_surf = font_val.render(val_str, True, COLOR_TEXT)
-        unit_surf = font_unit.render(self.unit, True, COLOR_NEON_MAGENTA)
-        label_surf = font_label.render(self.label.upper(), True, COLOR_GRID)
-        
-        surface.blit(val_surf,   (self.x - val_surf.get_width()//2,   self.y - 38))
-        surface.blit(unit_surf,  (self.x + self.radius - 15,          self.y - 12))
-        surface.blit(label_surf, (self.x - label_surf.get_width()//2, self.y + self.radius//2 + 8))
+    def _state(self):
+        """(arc index, displayed integer) - all that is visible of the value"""
+        return min(100, int(round(self.smooth_val * 100 / self.max_value))), int(round(self.smooth_val))
 
+    def changed(self):
+        """True if the gauge would look different from what was last drawn"""
+        return self._state() != self._drawn_state
 
-def get_cpu_temp():
-    """Read CPU temperature from reTerminal (Raspberry Pi CM4)"""
+    @classmethod
+    def _build_cache(cls, radius):
+        """Pre-render base + progress arcs for every integer percentage (0..100)"""
+        # Changed: Replaces 3 pygame.draw.arc calls per gauge per frame with one blit.
+        # Only the lower half (plus a few rows the arc ends spill into) is stored;
+        # the arcs aren't antialiased, so a colour key (alpha once uploaded) is exact
+        size = (radius*2, radius + cls.ARC_MARGIN)
+        rect = pygame.Rect(0, cls.ARC_MARGIN - radius, radius*2, radius*2)
+        frames = []
+        for i, end_angle in enumerate(_END_ANGLES):
+            surf = pygame.Surface(size)
+            surf.fill(ARC_COLORKEY)
+            pygame.draw.arc(surf, COLOR_GRID, rect, math.pi, 0, 4)
+            if i:
+                pygame.draw.arc(surf, COLOR_NEON_CYAN, rect, math.pi, end_angle, 8)
+                pygame.draw.arc(surf, COLOR_GLOW, rect, math.pi, end_angle, 14)
+            surf.set_colorkey(ARC_COLORKEY)
+            frames.append(surf)
+        cls._arc_cache[radius] = frames
+
+    @classmethod
+    def upload_arcs(cls, renderer):
+        """Replace every cached arc surface with a GPU texture, freeing the CPU copies"""
+        for radius, frames in cls._arc_cache.items():
+            cls._arc_cache[radius] = [Texture.from_surface(renderer, surf) for surf in frames]
+
+    def collect_blits(self):
+        """Return (surface or texture, dest) tuples for arcs + text, drawn in one batch"""
+        idx, iv = self._drawn_state = self._state()
+        arc_surf = self._arc_cache[self.radius][idx]
+
+        if iv != self._last_int_val:
+            glyphs = [DIGITS[ch] for ch in str(iv)]
+            cx = self.x - sum(g.get_width() for g in glyphs)//2
+            self._val_blits = []
+            for glyph in glyphs:
+                self._val_blits.append((glyph, (cx, self.y - 38)))
+                cx += glyph.get_width()
+            self._last_int_val = iv
+
+        return [
+            (arc_surf,         self._arc_pos),
+            *self._val_blits,
+            (self._unit_surf,  self._unit_pos),
+            (self._label_surf, self._label_pos),
+        ]
+
+
+def to_texture(renderer, textures, surf):
+    """Upload surf once; subsurfaces share their parent's texture via a source rect"""
+    parent = surf.get_parent()
+    if parent is None:
+        entry = (Texture.from_surface(renderer, surf), None)
+    else:
+        parent_tex = get_texture(renderer, textures, parent)[0]
+        entry = (parent_tex, pygame.Rect(surf.get_abs_offset(), surf.get_size()))
+    textures[surf] = entry
+    return entry
+
+
+def get_texture(renderer, textures, surf):
+    """(texture, source rect) of a cached surface, uploading it on first use"""
+    if isinstance(surf, Texture):
+        return surf, None       # already on the GPU (arc frames, background)
+    entry = textures.get(surf)
+    return entry if entry is not None else to_texture(renderer, textures, surf)
+
+
+def draw_batch(renderer, textures, blits):
+    """Draw a list of (surface or texture, dest) tuples from their GPU textures"""
+    # Changed: Replaces software blitting - only surfaces that never change go
+    # through here, so each one is uploaded exactly once
+    for surf, dest in blits:
+        tex, src = get_texture(renderer, textures, surf)
+        if src is None:
+            tex.draw(None, dest)
+        else:
+            # A bare position would be sized from the whole atlas texture
+            tex.draw(src, (dest[0], dest[1], src.w, src.h))
+
+
+# ================= SENSOR READINGS =================
+# Changed: temp and freq share one minimum-interval guard, so extra callers
+# reuse the last reading instead of hitting sysfs/psutil again
+STATS_MIN_INTERVAL = 0.5    # seconds
+_LAST_STATS = {}            # name -> (monotonic timestamp, value)
+
+
+def _throttled(name, reader):
+    """Return the cached reading for name unless it is older than STATS_MIN_INTERVAL"""
+    now = time.monotonic()
+    cached = _LAST_STATS.get(name)
+    if cached is not None and now - cached[0] < STATS_MIN_INTERVAL:
+        return cached[1]
+    value = reader()
+    _LAST_STATS[name] = (now, value)
+    return value
+
+
+# Changed: The thermal sysfs file is kept open and rewound instead of re-opened
+# on every read (sysfs regenerates the value on each read from offset 0)
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+_THERMAL_FILE = None
+
+
+def _read_cpu_temp():
+    global _THERMAL_FILE
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp") as f:
-            return float(f.read()) / 1000
+        if _THERMAL_FILE is None:
+            _THERMAL_FILE = open(THERMAL_PATH, 'rb', buffering=0)
+        _THERMAL_FILE.seek(0)
+        return float(_THERMAL_FILE.read()) / 1000
     except Exception as e:
+        # Drop the handle (e.g. ENODEV after a driver reload) so the next read re-opens it
+        if _THERMAL_FILE is not None:
+            _THERMAL_FILE.close()
+            _THERMAL_FILE = None
         logger.warning(f"Cannot read CPU temp: {e}")
         return 35.0
 
 
+def _probe_cpu_temp():
+    """Pick the temperature reader once: sysfs if the thermal zone exists, else a constant"""
+    if os.path.exists(THERMAL_PATH):
+        return _read_cpu_temp
+    logger.warning(f"{THERMAL_PATH} not found, reporting a fixed 35°C")
+    return lambda: 35.0
+
+
+def _probe_cpu_freq():
+    """Pick the frequency reader once: psutil if it reports a clock, else a constant"""
+    try:
+        if psutil.cpu_freq() is not None:
+            return lambda: psutil.cpu_freq().current
+    except Exception as e:
+        logger.warning(f"psutil.cpu_freq() unavailable: {e}")
+    return lambda: 1200.0
+
+
+# Changed: Capabilities are probed once at startup instead of taking the
+# exception path on every poll of a missing sensor
+_get_temp = _probe_cpu_temp()
+_get_freq = _probe_cpu_freq()
+
+
+def get_cpu_temp():
+    """Read CPU temperature from reTerminal (Raspberry Pi CM4)"""
+    return _throttled('temp', _get_temp)
+
+
+def get_cpu_freq():
+    """Current CPU frequency in MHz (1200 if it cannot be read)"""
+    return _throttled('freq', _get_freq)
+
+
+# ================= STATS POLLER =================
+# Changed: psutil/sysfs polling runs on a daemon thread so it never stalls a frame;
+# the render loop only reads the latest snapshot
+STATS_INTERVAL = 0.8        # seconds between polls
+_STATS = {'cpu': 0.0, 'ram': 0.0, 'disk': 0.0, 'temp': 35.0, 'freq': 1200.0}
+_STATS_LOCK = threading.Lock()
+
+
+def poll_stats():
+    """Refresh _STATS every STATS_INTERVAL seconds (runs forever on a daemon thread)"""
+    while True:
+        try:
+            sample = {
+                'cpu':  psutil.cpu_percent(interval=None),
+                'ram':  psutil.virtual_memory().percent,
+                'disk': psutil.disk_usage('/').percent,
+                'temp': get_cpu_temp(),
+                'freq': get_cpu_freq(),
+            }
+            with _STATS_LOCK:
+                _STATS.update(sample)
+        except Exception as e:
+            logger.warning(f"Stats collection error: {e}")
+        time.sleep(STATS_INTERVAL)
+
+
+def read_stats():
+    """Snapshot of the latest stats (safe to call from the render loop)"""
+    with _STATS_LOCK:
+        return dict(_STATS)
+
+
 def main():
     # ================= VERY IMPORTANT FOR SYSTEMD/BOOT =================
     # Changed: Critical for correct display initialization on reTerminal when run as service
@@ -105,19 +327,40 @@ def main():
     
     # Changed: Hide mouse cursor (essential for clean kiosk look on touchscreen)
     pygame.mouse.set_visible(False)
+
+    # Changed: Input is never handled, so don't let SDL queue any events at all
+    pygame.event.set_blocked(None)
     
     try:
-        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN | pygame.DOUBLEBUF)
+        # Changed: SDL2 render API instead of a software display surface, so the
+        # GPU composites the cached textures; software renderer as a fallback
+        window = Window("reTerminal SYSTEM HUD", (WIDTH, HEIGHT), fullscreen=True)
+        try:
+            renderer = Renderer(window, accelerated=1, vsync=True)
+        except Exception as e:
+            logger.warning(f"Accelerated renderer unavailable ({e}), using software renderer")
+            renderer = Renderer(window, accelerated=0)
         logger.info("Display initialized successfully on reTerminal")
     except Exception as e:
         logger.error(f"CRITICAL: Display init failed: {e}")
         return 1
 
-    pygame.display.set_caption("reTerminal SYSTEM HUD")
+    init_fonts()
     clock = pygame.time.Clock()
 
+    # Changed: Static background + grid rendered once, drawn as one texture
+    bg_surf = pygame.Surface((WIDTH, HEIGHT))
+    bg_surf.fill(COLOR_BG)
+    for x in range(0, WIDTH, 80):
+        pygame.draw.line(bg_surf, COLOR_GRID, (x, 0), (x, HEIGHT), 1)
+    for y in range(0, HEIGHT, 80):
+        pygame.draw.line(bg_surf, COLOR_GRID, (0, y), (WIDTH, y), 1)
+
     # Fonts prepared once
-    font_header = pygame.font.SysFont('dejavusansmono', 28, bold=True)
+    font_header = ft_font(28, bold=True)
+    header_surf = font_header.render("RETERMINAL  •  SYSTEM MONITOR", COLOR_NEON_CYAN)[0]
+    header_pos = (WIDTH//2 - header_surf.get_width()//2, 18)
+    bg_surf.blit(header_surf, header_pos)   # static, so part of the background
 
     # Gauges layout - slightly adjusted positions for better balance
     gauges = [
@@ -128,7 +371,26 @@ def main():
         CyberGauge(940,  520, 105, "CLOCK",  "MHz"),
     ]
 
+    threading.Thread(target=poll_stats, name="stats-poller", daemon=True).start()
+
+    # Every cached surface is uploaded once up front. The background and the arc
+    # frames (~22 MB) are replaced by their textures so no CPU copy stays alive;
+    # the small digit atlas and labels/units are looked up by surface
+    bg_tex = Texture.from_surface(renderer, bg_surf)
+    del bg_surf
+    CyberGauge.upload_arcs(renderer)
+    textures = {}
+    for surf in DIGITS.values():
+        get_texture(renderer, textures, surf)
+    for g in gauges:
+        for surf, _ in g.collect_blits():
+            get_texture(renderer, textures, surf)
+
     frame_count = 0
+    force_present = True
+    info_text = None
+    info_tex = None
+    info_rect = None
 
     # ================= MAIN LOOP - KIOSK MODE =================
     # Changed: 
@@ -137,72 +399,53 @@ def main():
     #   - Only pump events silently to prevent queue overflow
     while True:
         try:
-            # Pump all events but ignore them completely
-            # This is what makes the HUD "unclosable" by user
-            for event in pygame.event.get():
-                pass  # ← intentionally empty - no exit conditions!
-
-            # Update system stats only every ~0.8 seconds
-            if frame_count % 24 == 0:
-                try:
-                    cpu  = psutil.cpu_percent(interval=None)
-                    ram  = psutil.virtual_memory().percent
-                    disk = psutil.disk_usage('/').percent
-                    temp = get_cpu_temp()
-                    
-                    # CPU frequency handling with fallback
-                    try:
-                        freq_raw = psutil.cpu_freq().current
-                    except:
-                        freq_raw = 1200.0
-                    
-                    gauges[0].update(cpu)
-                    gauges[1].update(ram)
-                    gauges[2].update(disk)
-                    gauges[3].update(temp)
-                    # Changed: Better scaling (most CM4 max around 1500-2000MHz)
-                    gauges[4].update(freq_raw / 20.0)
-
-                except Exception as e:
-                    logger.warning(f"Stats collection error: {e}")
+            # Pump and drop all events in C without building Event objects
+            # This is what makes the HUD "unclosable" by user - no exit conditions!
+            pygame.event.clear()
+
+            # Latest stats from the poller thread (never blocks on psutil)
+            stats = read_stats()
+            gauges[0].update(stats['cpu'])
+            gauges[1].update(stats['ram'])
+            gauges[2].update(stats['disk'])
+            gauges[3].update(stats['temp'])
+            # Changed: Better scaling (most CM4 max around 1500-2000MHz)
+            gauges[4].update(stats['freq'] / 20.0)
 
             # Smooth animation step for all gauges
             for g in gauges:
                 g.tick()
 
             # ── DRAWING ───────────────────────────────────────────────
-            screen.fill(COLOR_BG)
-
-            # Light background grid
-            for x in range(0, WIDTH, 80):
-                pygame.draw.line(screen, COLOR_GRID, (x, 0), (x, HEIGHT), 1)
-            for y in range(0, HEIGHT, 80):
-                pygame.draw.line(screen, COLOR_GRID, (0, y), (WIDTH, y), 1)
-
-            # Header
-            header = font_header.render("RETERMINAL  •  SYSTEM MONITOR", True, COLOR_NEON_CYAN)
-            screen.blit(header, (WIDTH//2 - header.get_width()//2, 18))
-
-            # Draw all gauges
-            for gauge in gauges:
-                gauge.draw(screen)
-
             # Bottom-right real-time info
+            # Changed: Reuses the poller's readings (no extra cpu_freq() call);
+            # re-rendered and re-uploaded only when the text actually changes
             if frame_count % 10 == 0:
-                try:
-                    real_freq = psutil.cpu_freq().current
-                    freq_text = f"CPU {real_freq:>4.0f} MHz   •   {temp:>3.0f}°C"
-                    txt = font_header.render(freq_text, True, COLOR_TEXT)
-                    screen.blit(txt, (WIDTH - txt.get_width() - 30, HEIGHT - 50))
-                except:
-                    pass
-
-            pygame.display.flip()
+                freq_text = f"CPU {stats['freq']:>4.0f} MHz   •   {stats['temp']:>3.0f}°C"
+                if freq_text != info_text:
+                    info_surf = font_header.render(freq_text, COLOR_TEXT)[0]
+                    info_tex = Texture.from_surface(renderer, info_surf)
+                    info_rect = info_surf.get_rect(topright=(WIDTH - 30, HEIGHT - 50))
+                    info_text = freq_text
+                    force_present = True
+
+            # Changed: The whole frame is composited on the GPU, but only when a
+            # gauge or the info line changed - idle frames don't present at all
+            if force_present or any(g.changed() for g in gauges):
+                renderer.clear()
+                blits = [(bg_tex, (0, 0))]
+                for gauge in gauges:
+                    blits.extend(gauge.collect_blits())
+                draw_batch(renderer, textures, blits)
+                info_tex.draw(None, info_rect)
+                renderer.present()
+                force_present = False
             clock.tick(FPS)
             frame_count += 1
 
         except Exception as e:
             logger.error(f"Main loop error (will continue): {e}", exc_info=True)
+            force_present = True
             time.sleep(1)  # prevent CPU spin if something is repeatedly failing
 
     # Code never reaches here normally
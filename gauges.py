@@ -2,19 +2,12 @@ import sys
 import time
 import psutil
 import numpy as np
-import matplotlib.pyplot as plt
-import mplcyberpunk
+from functools import lru_cache
+from collections import deque
 from datetime import timedelta
-from matplotlib import cm
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.patches import Wedge, Circle
 from PyQt5.QtWidgets import QApplication, QWidget, QHBoxLayout, QVBoxLayout, QLabel
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QScreen
-
-# Apply cyberpunk style globally
-plt.style.use("cyberpunk")
+from PyQt5.QtCore import QTimer, Qt, QPointF, QRectF, QSize
+from PyQt5.QtGui import QScreen, QPainter, QPainterPath, QPixmap, QPolygonF, QColor, QFont, QPen
 
 def degree_range(n):
     start = np.linspace(0, 180, n + 1, endpoint=True)[:-1]
@@ -24,24 +17,358 @@ def degree_range(n):
 def rot_text(ang):
     return np.degrees(np.radians(ang) - np.radians(90))
 
-class MatplotlibCanvas(FigureCanvas):
-    def __init__(self, parent=None, width=5, height=5, dpi=100):
-        fig = Figure(figsize=(width, height), dpi=dpi, facecolor='black')
-        self.ax = fig.add_subplot(111)
-        super().__init__(fig)
-        self.setParent(parent)
-        self.fig = fig
+# Samples kept for the history lines (one per tick)
+HISTORY_LEN = 60
+
+# Poll periods (seconds) for stats that change much slower than the 1.5s tick
+RAM_POLL = 3
+DISK_POLL = 30
+
+# Static gauge geometry, shared by every gauge and every tick
+N_SEGMENTS = 20
+WEDGE_ANGS = degree_range(N_SEGMENTS)[0].tolist()
+# matplotlib's 'plasma' colormap sampled at 20 steps
+WEDGE_COLORS = ['#0d0887', '#2c0594', '#43039e', '#5901a5', '#6e00a8',
+                '#8305a7', '#9511a1', '#a72197', '#b6308b', '#c5407e',
+                '#d14e72', '#dd5e66', '#e76e5b', '#f07f4f', '#f79044',
+                '#fca338', '#feb72d', '#fccd25', '#f7e225', '#f0f921']
+
+def label_layout(n_labels):
+    """(x, y, rotation) lists for n_labels scale labels on the gauge arc."""
+    angs = np.linspace(0, 180, n_labels)
+    return (0.35*np.cos(np.radians(angs))).tolist(), \
+           (0.35*np.sin(np.radians(angs))).tolist(), \
+           rot_text(angs).tolist()
+
+LABEL_LAYOUT = {n: label_layout(n) for n in (5, 6)}
+
+@lru_cache(maxsize=None)
+def gauge_labels(min_val, max_val, n_labels):
+    return tuple(str(int(max_val - i*(max_val-min_val)/(n_labels-1))) for i in range(n_labels))
+
+def pt_to_px(points):
+    """Point sizes -> pixels at the 100 dpi the original matplotlib canvases used."""
+    return points * 100 / 72
+
+def gauge_font(points, bold=True):
+    font = QFont('DejaVu Sans')
+    font.setBold(bold)
+    font.setPixelSize(round(pt_to_px(points)))
+    return font
+
+def with_alpha(color, alpha):
+    color = QColor(color)
+    color.setAlphaF(alpha)
+    return color
+
+WEDGE_QCOLORS = [with_alpha(c, 0.7) for c in WEDGE_COLORS]
+CYAN = QColor('#00ffff')
+MAGENTA = QColor('#ff00ff')
+
+# Neon glow: (pen width in pt, alpha) strokes added on top of each other
+GLOW_PASSES = ((10, 0.12), (6, 0.2), (3, 0.35))
+
+def draw_glow(painter, color, stroke):
+    """Call stroke() once per GLOW_PASSES pen in Plus composition mode."""
+    painter.save()
+    painter.setCompositionMode(QPainter.CompositionMode_Plus)
+    for width, alpha in GLOW_PASSES:
+        painter.setPen(QPen(with_alpha(color, alpha), pt_to_px(width)))
+        stroke()
+    painter.restore()
+
+class SysfsValue:
+    """A sysfs attribute kept open and re-read from offset 0 on every poll."""
+    def __init__(self, path, scale=1.0):
+        self.path = path
+        self.scale = scale
+        self._file = None
+
+    def read(self):
+        if self._file is None:
+            self._file = open(self.path, 'rb', buffering=0)
+        try:
+            self._file.seek(0)
+            return float(self._file.read()) / self.scale
+        except OSError:
+            # e.g. ENODEV after a driver reload - re-open on the next poll
+            self._file.close()
+            self._file = None
+            raise
+
+def cpuinfo_mhz():
+    """First 'cpu MHz' entry of /proc/cpuinfo, 0.0 if the kernel doesn't report it."""
+    with open('/proc/cpuinfo') as f:
+        for line in f:
+            if line.startswith('cpu MHz'):
+                return float(line.split(':', 1)[1])
+    return 0.0
+
+class GaugeWidget(QWidget):
+    """Semicircular gauge painted directly with QPainter.
+
+    The scale (segments, labels, title) is rendered into a QPixmap whenever the
+    widget is resized; paintEvent just blits it and draws the needle and value.
+    Geometry is given in gauge units (the segment radius is 0.4).
+    """
+    # Gauge-unit extent kept visible inside the widget
+    X_RANGE = (-0.45, 0.45)
+    Y_RANGE = (-0.40, 0.45)
+
+    def __init__(self, title, unit, min_val=0, max_val=100, size=(400, 400),
+                 with_line=False, min_line=0, max_line=1,
+                 radius=0.4, needle_length=0.3, smaller=False, parent=None):
+        super().__init__(parent)
+        self.title, self.unit = title, unit
+        self.min_val, self.max_val = min_val, max_val
+        self.with_line, self.min_line, self.max_line = with_line, min_line, max_line
+        self.radius, self.needle_length, self.smaller = radius, needle_length, smaller
+        self.hint = QSize(*size)
+
+        self.label_font = gauge_font(10 if smaller else 12)
+        self.value_font = gauge_font(24 if smaller else 28)
+        self.title_font = gauge_font(14 if smaller else 18)
+        self.overlay_font = gauge_font(24)
+
+        self.value = min_val
+        self.history_xy = None
+        self.history_buf = np.empty(HISTORY_LEN, dtype=np.float32)
+        self.overlay = ""
+        self.facecolor = QColor('black')
+        self.needle_color = MAGENTA
+
+        self.static = None
+        self.scale = 1.0
+        self.origin = QPointF()
+
+    def sizeHint(self):
+        return self.hint
+
+    def to_px(self, x, y):
+        return QPointF(self.origin.x() + x*self.scale, self.origin.y() - y*self.scale)
+
+    def circle_rect(self, r):
+        c = self.to_px(0, 0)
+        r *= self.scale
+        return QRectF(c.x() - r, c.y() - r, 2*r, 2*r)
+
+    def draw_text(self, painter, x, y, text):
+        c = self.to_px(x, y)
+        painter.drawText(QRectF(c.x() - 300, c.y() - 100, 600, 200), Qt.AlignCenter, text)
+
+    def resizeEvent(self, event):
+        (x0, x1), (y0, y1) = self.X_RANGE, self.Y_RANGE
+        self.scale = min(self.width() / (x1 - x0), self.height() / (y1 - y0))
+        self.origin = QPointF(self.width()/2 - (x0 + x1)/2*self.scale,
+                              self.height()/2 + (y0 + y1)/2*self.scale)
+        self.static = self.render_static()
+        super().resizeEvent(event)
+
+    def render_static(self):
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Gauge segments - vibrant plasma colormap on a black face
+        outer = self.circle_rect(self.radius)
+        inner = self.circle_rect(self.radius - 0.10)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.black)
+        painter.drawPie(outer, 0, 180*16)
+        for (a0, a1), color in zip(WEDGE_ANGS, WEDGE_QCOLORS):
+            path = QPainterPath()
+            path.arcMoveTo(outer, a0)
+            path.arcTo(outer, a0, a1 - a0)
+            path.arcTo(inner, a1, a0 - a1)
+            path.closeSubpath()
+            painter.fillPath(path, color)
+
+        # Labels
+        n_labels = 5 if self.smaller else 6
+        labels = gauge_labels(self.min_val, self.max_val, n_labels)
+        painter.setPen(CYAN)
+        painter.setFont(self.label_font)
+        for lx, ly, rot, lab in zip(*LABEL_LAYOUT[n_labels], labels):
+            painter.save()
+            painter.translate(self.to_px(lx, ly))
+            painter.rotate(-rot)
+            painter.drawText(QRectF(-50, -25, 100, 50), Qt.AlignCenter, lab)
+            painter.restore()
+
+        # Title
+        painter.setPen(MAGENTA)
+        painter.setFont(self.title_font)
+        self.draw_text(painter, 0, -0.32, self.title)
+
+        painter.end()
+        return pixmap
+
+    def update_gauge(self, value, history=None, warning_temp=None):
+        self.value = value
+
+        # History line (CPU freq), in gauge units; scaled in place in a reused buffer
+        if self.with_line and history:
+            n = len(history)
+            y = self.history_buf[:n]
+            y[:] = np.fromiter(history, dtype=np.float32, count=n)
+            y -= self.min_line
+            y /= self.max_line - self.min_line
+            np.clip(y, 0, 1, out=y)
+            y *= 0.16
+            y -= 0.22
+            self.history_xy = (np.linspace(-0.35, 0.35, n), y)
+
+        # Warning background (cyberpunk dark red/purple)
+        facecolor, needle_color = 'black', '#ff00ff'
+        if warning_temp is not None:
+            if warning_temp > 75:
+                facecolor, needle_color = '#220011', '#ff0055'
+            elif warning_temp > 60:
+                facecolor, needle_color = '#221100', '#ff6600'
+        self.facecolor = QColor(facecolor)
+        self.needle_color = QColor(needle_color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), self.facecolor)
+        if self.static is not None:
+            painter.drawPixmap(0, 0, self.static)
+
+        # History line with glow (CPU freq)
+        if self.history_xy is not None:
+            line = QPolygonF([self.to_px(px, py) for px, py in zip(*self.history_xy)])
+            draw_glow(painter, CYAN, lambda: painter.drawPolyline(line))
+            painter.setPen(QPen(CYAN, pt_to_px(4)))
+            painter.drawPolyline(line)
+
+        self.draw_needle(painter)
+
+        # Value and overlay text
+        painter.setPen(CYAN)
+        painter.setFont(self.value_font)
+        self.draw_text(painter, 0, -0.08, f"{self.value:.1f}{self.unit}")
+        if self.overlay:
+            painter.setFont(self.overlay_font)
+            self.draw_text(painter, 0, 0.15, self.overlay)
+
+        # Hub
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(Qt.black)
+        painter.drawEllipse(self.circle_rect(0.03))
+        painter.setBrush(CYAN)
+        painter.drawEllipse(self.circle_rect(0.015))
+        painter.end()
+
+    def draw_needle(self, painter):
+        scale = (self.value - self.min_val) / (self.max_val - self.min_val) if self.max_val > self.min_val else 0
+        pos = np.radians(180 - 180 * scale)
+        ux, uy = np.cos(pos), np.sin(pos)
+        length = self.needle_length
+
+        def at(a, b):
+            # a along the needle, b across it
+            return self.to_px(a*ux - b*uy, a*uy + b*ux)
+
+        # Main needle: shaft 0.03 wide, head 0.08 wide and 0.1 long past the tip
+        arrow = QPolygonF([at(0, -0.015), at(length, -0.015), at(length, -0.04),
+                           at(length + 0.1, 0), at(length, 0.04), at(length, 0.015), at(0, 0.015)])
+        painter.setPen(QPen(CYAN, pt_to_px(2)))
+        painter.setBrush(self.needle_color)
+        painter.drawPolygon(arrow)
+
+        # Glow over the needle
+        draw_glow(painter, self.needle_color, lambda: painter.drawLine(at(0, 0), at(length, 0)))
+
+class LineChartWidget(QWidget):
+    """History line chart painted with QPainter; title, grid and ticks cached in a QPixmap."""
+    MARGINS = (34, 26, 12, 20)  # left, top, right, bottom in px
+
+    def __init__(self, title, ymin, ymax, size=(400, 180), parent=None):
+        super().__init__(parent)
+        self.title, self.ymin, self.ymax = title, ymin, ymax
+        self.hint = QSize(*size)
+        self.title_font = gauge_font(12, bold=False)
+        self.tick_font = gauge_font(8, bold=False)
+
+        self.data = None
+        self.static = None
+        self.plot = QRectF()
+
+    def sizeHint(self):
+        return self.hint
+
+    def to_px(self, i, v):
+        plot = self.plot
+        return QPointF(plot.left() + i * plot.width() / (HISTORY_LEN - 1),
+                       plot.bottom() - (v - self.ymin) / (self.ymax - self.ymin) * plot.height())
+
+    def resizeEvent(self, event):
+        left, top, right, bottom = self.MARGINS
+        self.plot = QRectF(left, top, self.width() - left - right, self.height() - top - bottom)
+        self.static = self.render_static()
+        super().resizeEvent(event)
+
+    def render_static(self):
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.black)
+        painter = QPainter(pixmap)
+        plot = self.plot
+        grid = with_alpha(CYAN, 0.1)
+        painter.setFont(self.tick_font)
+
+        # The x axis spans the full history window, so the ticks never move
+        for v in np.linspace(self.ymin, self.ymax, 6):
+            y = self.to_px(0, v).y()
+            painter.setPen(grid)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(CYAN)
+            painter.drawText(QRectF(0, y - 8, plot.left() - 4, 16),
+                             Qt.AlignRight | Qt.AlignVCenter, str(int(v)))
+        for i in range(0, HISTORY_LEN, 20):
+            x = self.to_px(i, self.ymin).x()
+            painter.setPen(grid)
+            painter.drawLine(QPointF(x, plot.top()), QPointF(x, plot.bottom()))
+            painter.setPen(CYAN)
+            painter.drawText(QRectF(x - 20, plot.bottom() + 2, 40, 16), Qt.AlignHCenter | Qt.AlignTop, str(i))
+
+        painter.setPen(MAGENTA)
+        painter.setFont(self.title_font)
+        painter.drawText(QRectF(0, 0, self.width(), plot.top()), Qt.AlignCenter, self.title)
+        painter.end()
+        return pixmap
+
+    def set_data(self, data):
+        self.data = np.fromiter(data, dtype=np.float32, count=len(data))
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self.static is not None:
+            painter.drawPixmap(0, 0, self.static)
+        if self.data is not None and len(self.data) > 1:
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setClipRect(self.plot)
+            line = QPolygonF([self.to_px(i, v) for i, v in enumerate(self.data)])
+            draw_glow(painter, CYAN, lambda: painter.drawPolyline(line))  # Neon glow!
+            painter.setPen(QPen(CYAN, pt_to_px(4)))
+            painter.drawPolyline(line)
+        painter.end()
 
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
 
-        # Canvases
-        self.cpu_canvas = MatplotlibCanvas(self, width=4.5, height=4.5, dpi=100)
-        self.cpu_small_canvas = MatplotlibCanvas(self, width=2.5, height=2.5, dpi=100)
-        self.ram_canvas = MatplotlibCanvas(self, width=4, height=2.2, dpi=100)
-        self.ram_line_canvas = MatplotlibCanvas(self, width=4, height=1.8, dpi=100)
-        self.disk_canvas = MatplotlibCanvas(self, width=4, height=4, dpi=100)
+        # Gauges and charts
+        self.cpu_gauge = GaugeWidget('CPU TEMP', '°C', 0, 100, size=(450, 450),
+                                     with_line=True, min_line=600, max_line=2000)
+        self.cpu_small_gauge = GaugeWidget('CPU %', '%', 0, 100, size=(250, 250),
+                                           radius=0.38, needle_length=0.22, smaller=True)
+        self.ram_gauge = GaugeWidget('RAM', '%', 0, 100, size=(400, 220))
+        self.ram_chart = LineChartWidget('RAM % (60s)', 0, 100, size=(400, 180))
+        self.disk_gauge = GaugeWidget('DISK', '%', 0, 100, size=(400, 400))
 
         # Header and status
         self.header_label = QLabel("SYSTEM MONITOR")
@@ -72,19 +399,19 @@ class MainWindow(QWidget):
         main_layout = QHBoxLayout()
 
         left_col = QVBoxLayout()
-        left_col.addWidget(self.cpu_canvas)
-        left_col.addWidget(self.cpu_small_canvas)
+        left_col.addWidget(self.cpu_gauge)
+        left_col.addWidget(self.cpu_small_gauge)
         left_widget = QWidget()
         left_widget.setLayout(left_col)
 
         ram_col = QVBoxLayout()
-        ram_col.addWidget(self.ram_canvas)
-        ram_col.addWidget(self.ram_line_canvas)
+        ram_col.addWidget(self.ram_gauge)
+        ram_col.addWidget(self.ram_chart)
         ram_widget = QWidget()
         ram_widget.setLayout(ram_col)
 
         right_col = QVBoxLayout()
-        right_col.addWidget(self.disk_canvas)
+        right_col.addWidget(self.disk_gauge)
         right_col.addStretch()
         right_col.addWidget(self.status_label, alignment=Qt.AlignRight | Qt.AlignBottom)
         right_widget = QWidget()
@@ -98,11 +425,23 @@ class MainWindow(QWidget):
         self.setLayout(outer_layout)
 
         # Data
-        self.cpu_history = []
-        self.ram_history = []
+        self.cpu_history = deque(maxlen=HISTORY_LEN)
+        self.ram_history = deque(maxlen=HISTORY_LEN)
         self.last_net_io = psutil.net_io_counters()
         self.last_net_time = time.time()
 
+        # Sensors
+        self.temp_sensor = SysfsValue('/sys/class/thermal/thermal_zone0/temp', 1000)
+        self.freq_sensor = SysfsValue('/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq', 1000)
+        self.read_freq = self.probe_cpu_freq
+
+        # Constant / slow-changing stats
+        self.boot_time = psutil.boot_time()
+        self.ram_last_t = 0
+        self.ram_percent = 0.0
+        self.disk_last_t = 0
+        self.disk_percent = 0.0
+
         # Timer
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_plots)
@@ -121,23 +460,27 @@ class MainWindow(QWidget):
     def update_plots(self):
         # System stats
         try:
-            with open('/sys/class/thermal/thermal_zone0/temp') as f:
-                cpu_temp = float(f.read().strip()) / 1000
+            cpu_temp = self.temp_sensor.read()
         except:
             cpu_temp = 0.0
 
         try:
-            with open('/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq') as f:
-                cpu_freq = float(f.read().strip()) / 1000
+            cpu_freq = self.read_freq()
         except:
             cpu_freq = 0.0
 
+        now = time.time()
         cpu_percent = psutil.cpu_percent(interval=None)
-        ram_percent = psutil.virtual_memory().percent
-        disk_percent = psutil.disk_usage('/').percent
+        if now - self.ram_last_t > RAM_POLL:
+            self.ram_percent = psutil.virtual_memory().percent
+            self.ram_last_t = now
+        if now - self.disk_last_t > DISK_POLL:
+            self.disk_percent = psutil.disk_usage('/').percent
+            self.disk_last_t = now
+        ram_percent = self.ram_percent
+        disk_percent = self.disk_percent
 
         # Network
-        now = time.time()
         io = psutil.net_io_counters()
         dt = now - self.last_net_time if self.last_net_time else 1
         down = (io.bytes_recv - self.last_net_io.bytes_recv) / dt / 1024 / 1024
@@ -146,126 +489,33 @@ class MainWindow(QWidget):
         self.last_net_time = now
 
         # Uptime (real system uptime)
-        uptime_str = str(timedelta(seconds=int(time.time() - psutil.boot_time()))).split('.')[0]
+        uptime_str = str(timedelta(seconds=int(now - self.boot_time))).split('.')[0]
 
         self.status_label.setText(f"↓ {down:.1f} ↑ {up:.1f} MB/s   |   Uptime: {uptime_str}")
 
         # History
         self.cpu_history.append(cpu_freq)
-        if len(self.cpu_history) > 60: self.cpu_history.pop(0)
         self.ram_history.append(ram_percent)
-        if len(self.ram_history) > 60: self.ram_history.pop(0)
 
         # Update gauges and lines
-        self.update_gauge(self.cpu_canvas.ax, cpu_temp, 0, 100, 'CPU TEMP', '°C',
-                          with_line=True, history=self.cpu_history, min_line=600, max_line=2000,
-                          warning_temp=cpu_temp)
-        self.cpu_canvas.draw()
-
-        self.update_gauge(self.cpu_small_canvas.ax, cpu_percent, 0, 100, 'CPU %', '%',
-                          radius=0.38, needle_length=0.22, smaller=True)
-        self.cpu_small_canvas.draw()
-
-        # CPU freq overlay
-        self.cpu_canvas.ax.text(0, 0.15, f"{cpu_freq:.0f} MHz",
-                                ha='center', va='center', fontsize=24,
-                                fontweight='bold', color='#00ffff')
-        self.cpu_canvas.draw()
-
-        self.update_gauge(self.ram_canvas.ax, ram_percent, 0, 100, 'RAM', '%')
-        self.ram_canvas.draw()
-
-        self.update_line(self.ram_line_canvas.ax, self.ram_history, 'RAM % (60s)', 0, 100)
-        self.ram_line_canvas.draw()
-
-        self.update_gauge(self.disk_canvas.ax, disk_percent, 0, 100, 'DISK', '%')
-        self.disk_canvas.draw()
-
-    def update_line(self, ax, data, title, ymin, ymax):
-        ax.clear()
-        ax.plot(data, color='#00ffff', linewidth=4)
-        mplcyberpunk.add_glow_effects()  # Neon glow!
-        ax.set_title(title, fontsize=12, color='#ff00ff')
-        ax.set_ylim(ymin, ymax)
-        ax.set_xlim(0, len(data)-1)
-        ax.grid(True, alpha=0.1, color='#00ffff')
-        ax.tick_params(colors='#00ffff', labelsize=8)
-        ax.set_facecolor('black')
-
-    def update_gauge(self, ax, value, min_val, max_val, title, unit,
-                     with_line=False, history=None, min_line=0, max_line=1,
-                     radius=0.4, needle_length=0.3, smaller=False, warning_temp=None):
-        ax.clear()
-        ax.set_facecolor('black')
-
-        # Warning background (cyberpunk dark red/purple)
-        needle_color = '#ff00ff'
-        if warning_temp is not None:
-            if warning_temp > 75:
-                ax.set_facecolor('#220011')
-                needle_color = '#ff0055'
-            elif warning_temp > 60:
-                ax.set_facecolor('#221100')
-                needle_color = '#ff6600'
-
-        # History line with glow (CPU freq)
-        if with_line and history:
-            x = np.linspace(-0.35, 0.35, len(history))
-            scaled = np.clip((np.array(history) - min_line) / (max_line - min_line), 0, 1)
-            y = -0.22 + 0.16 * scaled
-            ax.plot(x, y, color='#00ffff', linewidth=4)
-            mplcyberpunk.add_glow_effects()
-
-        # Gauge segments - vibrant plasma colormap
-        n_segments = 20
-        cmap = cm.get_cmap('plasma', n_segments)
-        gauge_colors = cmap(np.arange(n_segments))
-
-        ang_range, _ = degree_range(n_segments)
-
-        for ang, c in zip(ang_range, gauge_colors):
-            ax.add_patch(Wedge((0,0), radius, *ang, facecolor='black', lw=2))
-            ax.add_patch(Wedge((0,0), radius, *ang, width=0.10, facecolor=c, lw=2, alpha=0.7))
-
-        # Labels
-        n_labels = 5 if smaller else 6
-        labels = [str(int(max_val - i*(max_val-min_val)/(n_labels-1))) for i in range(n_labels)]
-        label_angs = np.linspace(0, 180, n_labels)
-        label_size = 10 if smaller else 12
-
-        for ang, lab in zip(label_angs, labels):
-            ax.text(0.35*np.cos(np.radians(ang)), 0.35*np.sin(np.radians(ang)), lab,
-                    ha='center', va='center', fontsize=label_size, fontweight='bold',
-                    color='#00ffff', rotation=rot_text(ang))
-
-        # Value and title
-        ax.text(0, -0.08, f"{value:.1f}{unit}", ha='center', va='center',
-                fontsize=28 if not smaller else 24, fontweight='bold', color='#00ffff')
-
-        ax.text(0, -0.32, title, ha='center', va='center',
-                fontsize=18 if not smaller else 14, fontweight='bold', color='#ff00ff')
-
-        # Needle with manual glow
-        scale = (value - min_val) / (max_val - min_val) if max_val > min_val else 0
-        pos = 180 - 180 * scale
-        nx = needle_length * np.cos(np.radians(pos))
-        ny = needle_length * np.sin(np.radians(pos))
-
-        # Glow under needle
-        ax.plot([0, nx*1.1], [0, ny*1.1], color='#ffffff', lw=10, alpha=0.2)
-        ax.plot([0, nx], [0, ny], color=needle_color, lw=5, alpha=0.7)
-
-        # Main needle
-        ax.arrow(0, 0, nx, ny, width=0.03, head_width=0.08, head_length=0.1,
-                 fc=needle_color, ec='#00ffff', lw=2)
-
-        ax.add_patch(Circle((0,0), 0.03, facecolor='black', zorder=10))
-        ax.add_patch(Circle((0,0), 0.015, facecolor='#00ffff', zorder=11))
-
-        ax.set_frame_on(False)
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.axis('equal')
+        self.cpu_gauge.overlay = f"{cpu_freq:.0f} MHz"
+        self.cpu_gauge.update_gauge(cpu_temp, history=self.cpu_history, warning_temp=cpu_temp)
+        self.cpu_small_gauge.update_gauge(cpu_percent)
+        self.ram_gauge.update_gauge(ram_percent)
+        self.ram_chart.set_data(self.ram_history)
+        self.disk_gauge.update_gauge(disk_percent)
+
+    def probe_cpu_freq(self):
+        # scaling_cur_freq can take >1ms on some cpufreq drivers (they query the
+        # hardware on every read). Time one read after opening; if it is slow and
+        # /proc/cpuinfo reports a clock, poll that instead from now on.
+        self.read_freq = self.freq_sensor.read
+        self.freq_sensor.read()
+        start = time.perf_counter()
+        freq = self.freq_sensor.read()
+        if time.perf_counter() - start > 500e-6 and cpuinfo_mhz() > 0:
+            self.read_freq = cpuinfo_mhz
+        return freq
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
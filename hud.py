@@ -3,6 +3,7 @@ import time
 import psutil
 import pygame
 import math
+import threading
 
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 1280, 720  # reTerminal native resolution
@@ -13,8 +14,24 @@ COLOR_NEON_MAGENTA = (255, 0, 255)
 COLOR_GRID = (20, 40, 60)
 COLOR_TEXT = (200, 240, 255)
 
+# Fonts are created once by init_fonts(), not per gauge per frame
+FONT_LARGE = None
+FONT_SMALL = None
+
+def init_fonts():
+    """Create the shared gauge fonts (call after pygame.init())."""
+    global FONT_LARGE, FONT_SMALL
+    FONT_LARGE = pygame.font.SysFont('Monospace', 40, bold=True)
+    FONT_SMALL = pygame.font.SysFont('Monospace', 18)
+
+# Arc end angle for every integer percentage; index = arc cache frame
+_END_ANGLES = [math.pi + (i / 100.0) * math.pi for i in range(101)]
+
 class CyberGauge:
     """A circular gauge with neon aesthetics."""
+    _arc_cache = {}  # radius -> pre-rendered arcs for 0..100 %
+    ARC_MARGIN = 4   # rows kept above the centre line
+
     def __init__(self, x, y, radius, label, unit="%"):
         self.x = x
         self.y = y
@@ -25,58 +42,167 @@ class CyberGauge:
         self.target_val = 0
         self.smooth_val = 0
 
+        # Static text is rendered once; the value only when it changes.
+        # convert_alpha() needs display.set_mode() first, so build gauges after it.
+        self._unit_surf = FONT_SMALL.render(unit, True, COLOR_NEON_MAGENTA).convert_alpha()
+        self._label_surf = FONT_SMALL.render(label, True, COLOR_GRID).convert_alpha()
+        self._unit_pos = (x + 25, y - 10)
+        self._label_pos = (x - self._label_surf.get_width()//2, y + 15)
+        if radius not in self._arc_cache:
+            self._build_cache(radius)
+        self._arc_pos = (x - radius, y - self.ARC_MARGIN)
+        self._last_int_val = -1
+        self._val_surf = None
+
     def update(self, value):
         self.target_val = value
         # Smooth interpolation for animation
         self.smooth_val += (self.target_val - self.smooth_val) * 0.1
 
-    def draw(self, surface):
-        # Draw base arc
-        rect = pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius * 2, self.radius * 2)
-        pygame.draw.arc(surface, COLOR_GRID, rect, math.pi, 0, 2)
-        
-        # Draw progress arc
-        angle = math.pi + (self.smooth_val / 100.0) * math.pi
-        pygame.draw.arc(surface, COLOR_NEON_CYAN, rect, math.pi, angle, 6)
-        
-        # Glow effect (simplified)
-        pygame.draw.arc(surface, (0, 100, 100), rect, math.pi, angle, 2)
+    @classmethod
+    def _build_cache(cls, radius):
+        """Pre-render the base + progress arcs for every integer percentage."""
+        # Lower half only (plus a few rows the arc ends spill into); the arcs are
+        # not antialiased, so an RLE colour key is exact and fast to blit
+        size = (radius * 2, radius + cls.ARC_MARGIN)
+        rect = pygame.Rect(0, cls.ARC_MARGIN - radius, radius * 2, radius * 2)
+        frames = []
+        for i, angle in enumerate(_END_ANGLES):
+            surf = pygame.Surface(size).convert()
+            surf.fill((0, 0, 0))
+            pygame.draw.arc(surf, COLOR_GRID, rect, math.pi, 0, 2)
+            if i:
+                pygame.draw.arc(surf, COLOR_NEON_CYAN, rect, math.pi, angle, 6)
+                # Glow effect (simplified)
+                pygame.draw.arc(surf, (0, 100, 100), rect, math.pi, angle, 2)
+            surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            frames.append(surf)
+        cls._arc_cache[radius] = frames
 
-        # Labels
-        font_large = pygame.font.SysFont('Monospace', 40, bold=True)
-        font_small = pygame.font.SysFont('Monospace', 18)
-        
-        val_text = font_large.render(f"{int(self.smooth_val)}", True, COLOR_TEXT)
-        unit_text = font_small.render(self.unit, True, COLOR_NEON_MAGENTA)
-        label_text = font_small.render(self.label, True, COLOR_GRID)
+    def collect_blits(self):
+        """Return the gauge arcs and text as (surface, dest) tuples for a batched blit."""
+        # Rounded, since the smoothing approaches its target from below
+        idx = min(100, max(0, int(round(self.smooth_val))))
+        arc_surf = self._arc_cache[self.radius][idx]
+
+        iv = int(round(self.smooth_val))
+        if iv != self._last_int_val:
+            self._val_surf = FONT_LARGE.render(str(iv), True, COLOR_TEXT).convert_alpha()
+            self._last_int_val = iv
 
-        surface.blit(val_text, (self.x - val_text.get_width()//2, self.y - 30))
-        surface.blit(unit_text, (self.x + 25, self.y - 10))
-        surface.blit(label_text, (self.x - label_text.get_width()//2, self.y + 15))
+        val_text = self._val_surf
+        return [
+            (arc_surf, self._arc_pos),
+            (val_text, (self.x - val_text.get_width()//2, self.y - 30)),
+            (self._unit_surf, self._unit_pos),
+            (self._label_surf, self._label_pos),
+        ]
 
-def get_cpu_temp():
+def blit_batch(surface, blits):
+    """Blit a list of (surface, dest) tuples in one call (fblits on pygame-ce)."""
+    if hasattr(surface, 'fblits'):
+        surface.fblits(blits)
+    else:
+        surface.blits(blits, doreturn=0)
+
+# Kept open and rewound on each read instead of open/close per call
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+_thermal_file = None
+
+def read_cpu_temp():
     """Reads reTerminal CPU temperature."""
+    global _thermal_file
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-            return float(f.read()) / 1000.0
+        if _thermal_file is None:
+            _thermal_file = open(THERMAL_PATH, "rb", buffering=0)
+        _thermal_file.seek(0)
+        return float(_thermal_file.read()) / 1000.0
     except:
+        # Re-open on the next call (e.g. ENODEV after a driver reload)
+        if _thermal_file is not None:
+            _thermal_file.close()
+            _thermal_file = None
         return 0.0
 
+# Sensor readers are picked once at startup, so a missing sensor costs a
+# constant lookup per poll instead of a raised and caught exception
+def _probe_cpu_temp():
+    if os.path.exists(THERMAL_PATH):
+        return read_cpu_temp
+    return lambda: 0.0
+
+def _probe_cpu_freq():
+    try:
+        if psutil.cpu_freq() is not None:
+            return lambda: psutil.cpu_freq().current
+    except Exception:
+        pass
+    return lambda: 0.0
+
+get_cpu_temp = _probe_cpu_temp()
+_get_freq = _probe_cpu_freq()
+
+# Latest system stats, refreshed by poll_stats() on a background thread
+STATS_INTERVAL = 0.5  # seconds
+_stats = {'cpu': 0.0, 'ram': 0.0, 'disk': 0.0, 'temp': 0.0, 'freq': 0.0}
+_stats_lock = threading.Lock()
+
+def poll_stats():
+    """Poll psutil/sysfs forever so the render loop never waits on them."""
+    while True:
+        try:
+            sample = {
+                'cpu': psutil.cpu_percent(),
+                'ram': psutil.virtual_memory().percent,
+                'disk': psutil.disk_usage('/').percent,
+                'temp': get_cpu_temp(),
+                'freq': _get_freq(),
+            }
+            with _stats_lock:
+                _stats.update(sample)
+        except Exception as e:
+            # Keep polling; a dead thread would freeze the gauges silently
+            print(f"Stats collection error: {e}")
+        time.sleep(STATS_INTERVAL)
+
+def read_stats():
+    """Return a snapshot of the latest stats."""
+    with _stats_lock:
+        return dict(_stats)
+
 def main():
     # Force full screen on the built-in display
     # Note: reTerminal usually maps LCD to :0.0
     os.environ['SDL_VIDEO_CENTERED'] = '1'
     pygame.init()
+    init_fonts()
     
     # Try to open in fullscreen. If testing on desktop, use pygame.RESIZABLE
     try:
-        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE)
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN | pygame.DOUBLEBUF)
     except:
         screen = pygame.display.set_mode((WIDTH, HEIGHT))
         
     pygame.display.set_caption("reTerminal HUD")
     clock = pygame.time.Clock()
     font_main = pygame.font.SysFont('Monospace', 22)
+    header_surf = font_main.render("RE-TERMINAL // SYSTEM_OVERRIDE_ACTIVE", True, COLOR_NEON_CYAN).convert_alpha()
+
+    # Static background: grid, decorative border and header line drawn once.
+    # convert() (valid only after set_mode) matches the display format for fast blits.
+    bg_surf = pygame.Surface((WIDTH, HEIGHT)).convert()
+    bg_surf.fill(COLOR_BG)
+    for i in range(0, WIDTH, 40):
+        pygame.draw.line(bg_surf, (10, 20, 30), (i, 0), (i, HEIGHT))
+    for i in range(0, HEIGHT, 40):
+        pygame.draw.line(bg_surf, (10, 20, 30), (0, i), (WIDTH, i))
+    pygame.draw.rect(bg_surf, COLOR_NEON_MAGENTA, (10, 10, WIDTH-20, HEIGHT-20), 1)
+    pygame.draw.line(bg_surf, COLOR_NEON_CYAN, (50, 60), (400, 60), 4)
+
+    # Scanline overlay, also static: one alpha blit instead of 180 line draws
+    scanline_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+    for y in range(0, HEIGHT, 4):
+        pygame.draw.line(scanline_surf, (0, 0, 0, 50), (0, y), (WIDTH, y))
 
     # Initialize Gauges
     gauges = [
@@ -87,6 +213,8 @@ def main():
         CyberGauge(640, 520, 100, "CLOCK", "MHz"),
     ]
 
+    threading.Thread(target=poll_stats, daemon=True).start()
+
     running = True
     frame_count = 0
 
@@ -96,46 +224,35 @@ def main():
                 running = False
 
         # 1. Background and Grid
-        screen.fill(COLOR_BG)
-        for i in range(0, WIDTH, 40):
-            pygame.draw.line(screen, (10, 20, 30), (i, 0), (i, HEIGHT))
-        for i in range(0, HEIGHT, 40):
-            pygame.draw.line(screen, (10, 20, 30), (0, i), (WIDTH, i))
+        screen.blit(bg_surf, (0, 0))
 
-        # 2. Update Stats (Throttle heavy calls)
+        # 2. Update Stats (polled on a background thread, applied every 15 frames)
         if frame_count % 15 == 0:
-            cpu_p = psutil.cpu_percent()
-            ram_p = psutil.virtual_memory().percent
-            disk_p = psutil.disk_usage('/').percent
-            temp = get_cpu_temp()
-            freq = psutil.cpu_freq().current / 20.0 # Normalized to 0-100 gauge scale for 2GHz
+            stats = read_stats()
+            freq = stats['freq'] / 20.0 # Normalized to 0-100 gauge scale for 2GHz
+            freq_txt = font_main.render(f"CORE_CLOCK: {stats['freq']:.1f} MHz", True, COLOR_TEXT).convert_alpha()
             
-            gauges[0].update(cpu_p)
-            gauges[1].update(ram_p)
-            gauges[2].update(disk_p)
-            gauges[3].update(temp)
+            gauges[0].update(stats['cpu'])
+            gauges[1].update(stats['ram'])
+            gauges[2].update(stats['disk'])
+            gauges[3].update(stats['temp'])
             gauges[4].update(freq)
 
-        # 3. Draw UI Elements
-        # Decorative border
-        pygame.draw.rect(screen, COLOR_NEON_MAGENTA, (10, 10, WIDTH-20, HEIGHT-20), 1)
-        pygame.draw.line(screen, COLOR_NEON_CYAN, (50, 60), (400, 60), 4)
-        
-        header = font_main.render("RE-TERMINAL // SYSTEM_OVERRIDE_ACTIVE", True, COLOR_NEON_CYAN)
-        screen.blit(header, (60, 30))
+        # 3. Draw UI Elements (border and header line are part of bg_surf)
+        blits = [(header_surf, (60, 30))]
 
         # 4. Draw Gauges
         for gauge in gauges:
-            gauge.draw(screen)
+            blits.extend(gauge.collect_blits())
+
+        blit_batch(screen, blits)
 
         # 5. Scanline Effect (Cyberpunk aesthetic)
         if frame_count % 2 == 0:
-            for y in range(0, HEIGHT, 4):
-                pygame.draw.line(screen, (0, 0, 0, 50), (0, y), (WIDTH, y))
+            screen.blit(scanline_surf, (0, 0))
 
-        # 6. Real-time Clock Speed text
-        freq_raw = psutil.cpu_freq().current
-        freq_txt = font_main.render(f"CORE_CLOCK: {freq_raw:.1f} MHz", True, COLOR_TEXT)
+        # 6. Real-time Clock Speed text (refreshed together with the stats above),
+        # drawn over the scanlines so it stays crisp
         screen.blit(freq_txt, (WIDTH - 350, 30))
 
         pygame.display.flip()